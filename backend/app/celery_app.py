@@ -14,6 +14,7 @@ if settings.REDIS_URL:
         "hang",
         broker=settings.REDIS_URL,
         backend=settings.REDIS_URL,
+        include=["app.tasks"],
     )
     celery_app.conf.update(
         task_serializer="json",
@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     FRONTEND_URL: str = "http://localhost:5173"
     CORS_ORIGINS: str = "http://localhost:5173,http://127.0.0.1:5173"
     REDIS_URL: str = ""  # e.g. "redis://localhost:6379/0"
+    EMBED_THREADS: int = 0  # onnxruntime intra-op threads for fastembed; 0 = all cores
+    PRELOAD_EMBEDDINGS: bool = False  # load + warm the embedding model at startup
+    CHAT_HISTORY_LIMIT: int = 0  # newest thread messages replayed to the model per chat turn; 0 = all
 
     model_config = SettingsConfigDict(env_file=".env")
 
@@ -58,22 +58,20 @@ async def get_trends(
     # 1. Quiz accuracy by week
     quiz_accuracy: list[WeeklyQuizAccuracy] = []
     quiz_result = await db.execute(
-        select(QuizAttempt).where(
+        select(QuizAttempt.completed_at, QuizAttempt.score, QuizAttempt.total_questions).where(
             QuizAttempt.user_id == current_user.id,
             QuizAttempt.completed_at >= datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc),
             QuizAttempt.total_questions > 0,
-        ).order_by(QuizAttempt.completed_at)
+        )
     )
-    attempts = quiz_result.scalars().all()
     # Group by week
     quiz_by_week: dict[str, list] = {}
-    for a in attempts:
-        completed = a.completed_at
+    for completed, score, total_questions in quiz_result:
         if completed.tzinfo is None:
             completed = completed.replace(tzinfo=timezone.utc)
         week_start = (completed.date() - timedelta(days=completed.weekday())).isoformat()
         quiz_by_week.setdefault(week_start, []).append(
-            round(a.score * 100 / a.total_questions)
+            round(score * 100 / total_questions)
         )
     for w in range(weeks):
         wk = (start_date + timedelta(weeks=w)).isoformat()
@@ -88,19 +86,17 @@ async def get_trends(
     # 2. Flashcard retention by week (from FlashcardReview history)
     flashcard_retention: list[WeeklyFlashcardRetention] = []
     review_result = await db.execute(
-        select(FlashcardReview).where(
+        select(FlashcardReview.reviewed_at, FlashcardReview.quality).where(
             FlashcardReview.user_id == current_user.id,
             FlashcardReview.reviewed_at >= datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc),
-        ).order_by(FlashcardReview.reviewed_at)
+        )
     )
-    reviews = review_result.scalars().all()
     reviews_by_week: dict[str, list[int]] = {}
-    for r in reviews:
-        reviewed = r.reviewed_at
+    for reviewed, quality in review_result:
         if reviewed.tzinfo is None:
             reviewed = reviewed.replace(tzinfo=timezone.utc)
         week_start = (reviewed.date() - timedelta(days=reviewed.weekday())).isoformat()
-        reviews_by_week.setdefault(week_start, []).append(r.quality)
+        reviews_by_week.setdefault(week_start, []).append(quality)
     for w in range(weeks):
         wk = (start_date + timedelta(weeks=w)).isoformat()
         if wk in reviews_by_week:
@@ -115,21 +111,19 @@ async def get_trends(
     # 3. Study minutes by week (from pomodoro sessions)
     study_minutes: list[WeeklyStudyMinutes] = []
     session_result = await db.execute(
-        select(StudySession).where(
+        select(StudySession.started_at, StudySession.duration_minutes).where(
             StudySession.user_id == current_user.id,
             StudySession.session_type == "focus",
             StudySession.completed == True,  # noqa: E712
             StudySession.started_at >= datetime(start_date.year, start_date.month, start_date.day, tzinfo=timezone.utc),
-        ).order_by(StudySession.started_at)
+        )
     )
-    sessions = session_result.scalars().all()
     sessions_by_week: dict[str, int] = {}
-    for s in sessions:
-        started = s.started_at
+    for started, duration_minutes in session_result:
         if started.tzinfo is None:
             started = started.replace(tzinfo=timezone.utc)
         week_start = (started.date() - timedelta(days=started.weekday())).isoformat()
-        sessions_by_week[week_start] = sessions_by_week.get(week_start, 0) + s.duration_minutes
+        sessions_by_week[week_start] = sessions_by_week.get(week_start, 0) + duration_minutes
     for w in range(weeks):
         wk = (start_date + timedelta(weeks=w)).isoformat()
         study_minutes.append(WeeklyStudyMinutes(week=wk, minutes=sessions_by_week.get(wk, 0)))
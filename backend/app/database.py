@@ -16,8 +16,8 @@ class Base(DeclarativeBase):
     pass
 
 
-async def init_db() -> None:
-    # Import all model modules so tables are registered with Base.metadata
+def import_models() -> None:
+    """Import every model module so all tables are registered with Base.metadata."""
     import app.auth.models  # noqa: F401
     import app.notes.models  # noqa: F401
     import app.llm.models  # noqa: F401
@@ -41,6 +41,10 @@ async def init_db() -> None:
     import app.reviews.models  # noqa: F401
     import app.plugins.models  # noqa: F401
 
+
+async def init_db() -> None:
+    import_models()
+
     from app.plugins.loader import discover_plugins
     discover_plugins()
 
@@ -210,3 +214,19 @@ async def init_db() -> None:
             ))
         except Exception:
             pass
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_uploaded_files_user_created "
+            "ON uploaded_files (user_id, created_at)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_notifications_user_created "
+            "ON notifications (user_id, created_at)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_notifications_user_read "
+            "ON notifications (user_id, is_read)"
+        ))
+        await conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_documents_user_updated "
+            "ON documents (user_id, updated_at)"
+        ))
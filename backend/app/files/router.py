@@ -6,8 +6,9 @@ from typing import Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Query, UploadFile, File
 from jose import JWTError, jwt as jose_jwt
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from starlette.responses import FileResponse as StarletteFileResponse
 
 from app.config import settings
@@ -17,7 +18,8 @@ from app.auth.models import User
 from app.files.models import UploadedFile
 from app.files.schemas import FileResponse
 from pydantic import BaseModel
-from app.files.transcription import transcribe_audio_background
+from app.files.uploads import save_upload
+from app.task_dispatch import dispatch_transcribe_audio
 from app.imports.extractors import (
     extract_pdf_text, extract_pptx_text,
     detect_url_type, extract_arxiv_content, extract_webpage_content,
@@ -31,7 +33,8 @@ router = APIRouter()
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 
-MEDIA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "media", "files")
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+MEDIA_DIR = os.path.join(BACKEND_DIR, "media", "files")
 
 EXTENSION_TYPE_MAP = {
     ".pdf": "pdf",
@@ -70,7 +73,9 @@ MIME_MAP = {
 }
 
 
-def _file_to_response(f: UploadedFile) -> dict:
+def _file_to_response(f: UploadedFile, has_extracted_text: bool | None = None) -> dict:
+    if has_extracted_text is None:
+        has_extracted_text = bool(f.extracted_text)
     metadata = None
     if f.metadata_json:
         try:
@@ -84,17 +89,44 @@ def _file_to_response(f: UploadedFile) -> dict:
         "mime_type": f.mime_type,
         "size_bytes": f.size_bytes,
         "folder_id": f.folder_id,
-        "has_extracted_text": bool(f.extracted_text),
+        "has_extracted_text": has_extracted_text,
         "metadata": metadata,
         "source_url": f.source_url,
         "created_at": f.created_at,
         "updated_at": f.updated_at,
     }
     if f.file_type == "audio":
-        resp["transcription_status"] = "complete" if f.extracted_text else "pending"
+        resp["transcription_status"] = "complete" if has_extracted_text else "pending"
     return resp
 
 
+def _get_openai_key(user: User) -> str | None:
+    if user.encrypted_openai_key:
+        try:
+            return decrypt_api_key(user.encrypted_openai_key)
+        except Exception:
+            return None
+    return None
+
+
+def _abs_path(f: UploadedFile) -> str:
+    return os.path.join(BACKEND_DIR, f.file_path)
+
+
+async def _get_file_or_404(db: AsyncSession, file_id: int, user_id: int) -> UploadedFile:
+    result = await db.execute(
+        select(UploadedFile).where(
+            UploadedFile.id == file_id,
+            UploadedFile.user_id == user_id,
+            UploadedFile.deleted == False,
+        )
+    )
+    f = result.scalar_one_or_none()
+    if not f:
+        raise HTTPException(404, "File not found")
+    return f
+
+
 @router.post("", response_model=FileResponse, status_code=201)
 async def upload_file_endpoint(
     background_tasks: BackgroundTasks,
@@ -103,14 +135,8 @@ async def upload_file_endpoint(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(400, "File too large (max 50MB)")
-
     original_name = file.filename or "unnamed"
-    ext = ""
-    if "." in original_name:
-        ext = "." + original_name.rsplit(".", 1)[-1].lower()
+    ext = os.path.splitext(original_name)[1].lower()
 
     if ext not in EXTENSION_TYPE_MAP:
         raise HTTPException(400, f"Unsupported file type: {ext}")
@@ -125,15 +151,17 @@ async def upload_file_endpoint(
 
     # Save to disk
     uuid_name = f"{uuid.uuid4().hex}{ext}"
-    os.makedirs(MEDIA_DIR, exist_ok=True)
     file_path = os.path.join(MEDIA_DIR, uuid_name)
-    with open(file_path, "wb") as f:
-        f.write(content)
+    size_bytes = await save_upload(file, file_path, MAX_FILE_SIZE)
 
     # Extract text for supported types
     extracted_text = None
     metadata = {}
 
+    if ext in (".pdf", ".pptx"):
+        with open(file_path, "rb") as f:
+            content = f.read()
+
     if ext == ".pdf":
         try:
             extracted_text = await extract_pdf_text(content)
@@ -142,7 +170,7 @@ async def upload_file_endpoint(
             reader = PdfReader(io.BytesIO(content))
             metadata["page_count"] = len(reader.pages)
         except Exception as e:
-            logger.warning(f"PDF text extraction failed: {e}")
+            logger.warning("PDF text extraction failed: %s", e)
     elif ext == ".pptx":
         try:
             extracted_text = await extract_pptx_text(content)
@@ -151,7 +179,7 @@ async def upload_file_endpoint(
             prs = Presentation(io.BytesIO(content))
             metadata["page_count"] = len(prs.slides)
         except Exception as e:
-            logger.warning(f"PPTX text extraction failed: {e}")
+            logger.warning("PPTX text extraction failed: %s", e)
 
     metadata_json = json.dumps(metadata) if metadata else None
 
@@ -162,7 +190,7 @@ async def upload_file_endpoint(
         file_type=file_type,
         mime_type=mime_type,
         file_path=f"media/files/{uuid_name}",
-        size_bytes=len(content),
+        size_bytes=size_bytes,
         metadata_json=metadata_json,
         folder_id=folder_id,
         extracted_text=extracted_text,
@@ -173,13 +201,9 @@ async def upload_file_endpoint(
 
     # Trigger background transcription for audio files
     if file_type == "audio":
-        _oai_key = None
-        if current_user.encrypted_openai_key:
-            try:
-                _oai_key = decrypt_api_key(current_user.encrypted_openai_key)
-            except Exception:
-                pass
-        background_tasks.add_task(transcribe_audio_background, record.id, file_path, _oai_key)
+        dispatch_transcribe_audio(
+            record.id, file_path, current_user.encrypted_openai_key, background_tasks
+        )
 
     return _file_to_response(record)
 
@@ -193,7 +217,12 @@ async def list_files(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    stmt = select(UploadedFile).where(
+    # Extracted text can be a whole PDF — the list only needs to know whether
+    # it exists, so compute that in SQL and leave the column unloaded.
+    has_text = func.coalesce(func.length(UploadedFile.extracted_text), 0) > 0
+    stmt = select(UploadedFile, has_text).options(
+        defer(UploadedFile.extracted_text)
+    ).where(
         UploadedFile.user_id == current_user.id,
         UploadedFile.deleted == False,
     )
@@ -204,7 +233,7 @@ async def list_files(
 
     stmt = stmt.order_by(UploadedFile.created_at.desc()).offset(offset).limit(limit)
     result = await db.execute(stmt)
-    return [_file_to_response(f) for f in result.scalars().all()]
+    return [_file_to_response(f, has_extracted_text=bool(t)) for f, t in result.all()]
 
 
 @router.get("/{file_id}", response_model=FileResponse)
@@ -213,16 +242,7 @@ async def get_file(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(UploadedFile).where(
-            UploadedFile.id == file_id,
-            UploadedFile.user_id == current_user.id,
-            UploadedFile.deleted == False,
-        )
-    )
-    f = result.scalar_one_or_none()
-    if not f:
-        raise HTTPException(404, "File not found")
+    f = await _get_file_or_404(db, file_id, current_user.id)
     return _file_to_response(f)
 
 
@@ -243,16 +263,7 @@ async def serve_file(
     except (JWTError, ValueError):
         raise HTTPException(401, "Invalid token")
 
-    result = await db.execute(
-        select(UploadedFile).where(
-            UploadedFile.id == file_id,
-            UploadedFile.user_id == user_id,
-            UploadedFile.deleted == False,
-        )
-    )
-    f = result.scalar_one_or_none()
-    if not f:
-        raise HTTPException(404, "File not found")
+    f = await _get_file_or_404(db, file_id, user_id)
     if f.file_type == "link":
         # Proxy external PDFs (e.g. arXiv) so the frontend PdfViewer can render them
         metadata = {}
@@ -275,10 +286,7 @@ async def serve_file(
             headers={"Content-Disposition": f'inline; filename="{f.original_name}.pdf"'},
         )
 
-    abs_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        f.file_path,
-    )
+    abs_path = _abs_path(f)
     if not os.path.isfile(abs_path):
         raise HTTPException(404, "File not found on disk")
 
@@ -296,16 +304,7 @@ async def get_file_text(
     current_user: User = Depends(get_current_user),
 ):
     """Get extracted text for a file (used for convert-to-notes)."""
-    result = await db.execute(
-        select(UploadedFile).where(
-            UploadedFile.id == file_id,
-            UploadedFile.user_id == current_user.id,
-            UploadedFile.deleted == False,
-        )
-    )
-    f = result.scalar_one_or_none()
-    if not f:
-        raise HTTPException(404, "File not found")
+    f = await _get_file_or_404(db, file_id, current_user.id)
     if not f.extracted_text:
         raise HTTPException(400, "No extracted text available for this file")
     return {"text": f.extracted_text, "source_name": f.original_name}
@@ -322,16 +321,7 @@ async def update_file(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(UploadedFile).where(
-            UploadedFile.id == file_id,
-            UploadedFile.user_id == current_user.id,
-            UploadedFile.deleted == False,
-        )
-    )
-    f = result.scalar_one_or_none()
-    if not f:
-        raise HTTPException(404, "File not found")
+    f = await _get_file_or_404(db, file_id, current_user.id)
     if body.folder_id is not None:
         f.folder_id = body.folder_id if body.folder_id != 0 else None
     await db.commit()
@@ -366,33 +356,17 @@ async def transcribe_file(
     current_user: User = Depends(get_current_user),
 ):
     """Manually trigger transcription for an audio file."""
-    _oai_key = None
-    if current_user.encrypted_openai_key:
-        try:
-            _oai_key = decrypt_api_key(current_user.encrypted_openai_key)
-        except Exception:
-            pass
-    if not settings.OPENAI_API_KEY and not _oai_key:
+    if not settings.OPENAI_API_KEY and not _get_openai_key(current_user):
         raise HTTPException(400, "Transcription unavailable: no OpenAI API key configured")
 
-    result = await db.execute(
-        select(UploadedFile).where(
-            UploadedFile.id == file_id,
-            UploadedFile.user_id == current_user.id,
-            UploadedFile.deleted == False,
-        )
-    )
-    f = result.scalar_one_or_none()
-    if not f:
-        raise HTTPException(404, "File not found")
+    f = await _get_file_or_404(db, file_id, current_user.id)
     if f.file_type != "audio":
         raise HTTPException(400, "Only audio files can be transcribed")
 
-    abs_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        f.file_path,
+    abs_path = _abs_path(f)
+    dispatch_transcribe_audio(
+        f.id, abs_path, current_user.encrypted_openai_key, background_tasks
     )
-    background_tasks.add_task(transcribe_audio_background, f.id, abs_path, _oai_key)
     return {"status": "transcribing"}
 
 
@@ -440,7 +414,7 @@ async def import_url(
         else:
             text, title, metadata = await extract_webpage_content(url)
     except Exception as e:
-        logger.error(f"URL extraction failed for {url}: {e}")
+        logger.error("URL extraction failed for %s: %s", url, e)
         raise HTTPException(400, f"Failed to extract content from URL: {e}")
 
     from urllib.parse import urlparse as _urlparse
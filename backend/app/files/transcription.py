@@ -17,7 +17,7 @@ async def transcribe_audio(file_path: str, openai_api_key: str | None = None) ->
 
     file_size = os.path.getsize(file_path)
     if file_size > WHISPER_MAX_BYTES:
-        logger.warning(f"Audio file too large for Whisper ({file_size} bytes > 25MB), skipping")
+        logger.warning("Audio file too large for Whisper (%d bytes > 25MB), skipping", file_size)
         return None
 
     try:
@@ -31,7 +31,7 @@ async def transcribe_audio(file_path: str, openai_api_key: str | None = None) ->
             )
         return transcript.text
     except Exception as e:
-        logger.error(f"Transcription failed: {e}")
+        logger.error("Transcription failed: %s", e)
         return None
 
 
@@ -0,0 +1,23 @@
+import contextlib
+import os
+
+from fastapi import HTTPException, UploadFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def save_upload(file: UploadFile, dest: str, max_bytes: int) -> int:
+    """Stream an upload to disk in chunks, enforcing max_bytes. Returns bytes written."""
+    size = 0
+    try:
+        with open(dest, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(400, f"File too large (max {max_bytes // (1024 * 1024)}MB)")
+                out.write(chunk)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(dest)
+        raise
+    return size
@@ -108,29 +108,15 @@ async def get_stats(
 ):
     now = datetime.now(timezone.utc)
 
-    # Total
     result = await db.execute(
-        select(sa_func.count(Flashcard.id)).where(Flashcard.user_id == current_user.id)
+        select(
+            sa_func.count(Flashcard.id),
+            sa_func.count(Flashcard.id).filter(Flashcard.next_review <= now),
+            # Mastered = interval >= 21 days
+            sa_func.count(Flashcard.id).filter(Flashcard.interval >= 21),
+        ).where(Flashcard.user_id == current_user.id)
     )
-    total = result.scalar() or 0
-
-    # Due today
-    result = await db.execute(
-        select(sa_func.count(Flashcard.id)).where(
-            Flashcard.user_id == current_user.id,
-            Flashcard.next_review <= now,
-        )
-    )
-    due_today = result.scalar() or 0
-
-    # Mastered (interval >= 21 days)
-    result = await db.execute(
-        select(sa_func.count(Flashcard.id)).where(
-            Flashcard.user_id == current_user.id,
-            Flashcard.interval >= 21,
-        )
-    )
-    mastered = result.scalar() or 0
+    total, due_today, mastered = result.one()
 
     learning = total - mastered
 
@@ -14,7 +14,7 @@ from app.deps import get_db, get_current_user
 from app.auth.models import User
 from app.database import async_session
 from app.llm.service import ApiKeyRequiredError
-from app.search.service import embed_text, cosine_similarity
+from app.search.service import embed_text, cosine_similarities
 from app.search.models import NoteEmbedding
 from app.notes.models import Document
 from app.notifications.helpers import create_notification
@@ -91,16 +91,13 @@ async def _get_similar_questions(
     db: AsyncSession, query_vec: list[float], exclude_id: int | None = None
 ) -> list[SimilarQuestion]:
     result = await db.execute(
-        select(ForumQuestionEmbedding, ForumQuestion.title, ForumQuestion.id)
+        select(ForumQuestionEmbedding.embedding, ForumQuestion.title, ForumQuestion.id)
         .join(ForumQuestion, ForumQuestionEmbedding.question_id == ForumQuestion.id)
     )
-    rows = result.all()
+    rows = [r for r in result.all() if exclude_id is None or r.id != exclude_id]
     scored: list[SimilarQuestion] = []
-    for emb, title, qid in rows:
-        if exclude_id is not None and qid == exclude_id:
-            continue
-        doc_vec = json.loads(emb.embedding)
-        sim = cosine_similarity(query_vec, doc_vec)
+    sims = cosine_similarities(query_vec, [emb for emb, _, _ in rows])
+    for (_, title, qid), sim in zip(rows, sims):
         if sim >= 0.5:
             scored.append(SimilarQuestion(id=qid, title=title, score=round(sim, 4)))
     scored.sort(key=lambda x: x.score, reverse=True)
@@ -111,7 +108,7 @@ async def _get_related_notes(
     db: AsyncSession, query_vec: list[float], user_id: int
 ) -> list[RelatedNote]:
     result = await db.execute(
-        select(NoteEmbedding, Document.title, Document.id)
+        select(NoteEmbedding.embedding, Document.title, Document.id)
         .join(Document, NoteEmbedding.document_id == Document.id)
         .where(
             Document.user_id == user_id,
@@ -120,9 +117,8 @@ async def _get_related_notes(
     )
     rows = result.all()
     scored: list[RelatedNote] = []
-    for emb, title, doc_id in rows:
-        doc_vec = json.loads(emb.embedding)
-        sim = cosine_similarity(query_vec, doc_vec)
+    sims = cosine_similarities(query_vec, [emb for emb, _, _ in rows])
+    for (_, title, doc_id), sim in zip(rows, sims):
         if sim >= 0.5:
             scored.append(RelatedNote(id=doc_id, title=title or "Untitled", score=round(sim, 4)))
     scored.sort(key=lambda x: x.score, reverse=True)
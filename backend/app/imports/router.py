@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crypto import decrypt_api_key
 from app.deps import get_db, get_current_user
+from app.files.uploads import save_upload
 from app.auth.models import User
 from app.notes.models import Document, Folder, Tag, document_tags
 from app.imports.extractors import extract_pdf_text, extract_pptx_text, extract_youtube_transcript
@@ -246,15 +247,12 @@ def _copy_media_file(src_path: str, filename: str) -> str:
 @router.post("/notion", response_model=ImportResult)
 async def import_notion(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Import notes from a Notion export (zip of markdown files)."""
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(400, "File too large (max 50MB)")
-
     filename = file.filename or "notion.zip"
     if not filename.endswith(".zip"):
         raise HTTPException(400, "Please upload a .zip file")
@@ -262,8 +260,7 @@ async def import_notion(
     tmp_dir = tempfile.mkdtemp()
     try:
         zip_path = os.path.join(tmp_dir, "upload.zip")
-        with open(zip_path, "wb") as f:
-            f.write(content)
+        await save_upload(file, zip_path, MAX_FILE_SIZE)
 
         try:
             with zipfile.ZipFile(zip_path, "r") as zf:
@@ -334,29 +331,30 @@ async def import_notion(
 
         await db.commit()
 
+        # Removing the extracted tree can take a while for big vaults;
+        # do it after the response is sent
+        background_tasks.add_task(shutil.rmtree, tmp_dir, ignore_errors=True)
         return ImportResult(
             imported=len(created_notes),
             folder_id=root_folder.id,
             folder_name=folder_name,
             notes=created_notes,
         )
-    finally:
+    except BaseException:
         shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
 
 
 @limiter.limit("10/minute")
 @router.post("/obsidian", response_model=ImportResult)
 async def import_obsidian(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Import notes from an Obsidian vault export (zip)."""
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(400, "File too large (max 50MB)")
-
     filename = file.filename or "obsidian.zip"
     if not filename.endswith(".zip"):
         raise HTTPException(400, "Please upload a .zip file")
@@ -364,8 +362,7 @@ async def import_obsidian(
     tmp_dir = tempfile.mkdtemp()
     try:
         zip_path = os.path.join(tmp_dir, "upload.zip")
-        with open(zip_path, "wb") as f:
-            f.write(content)
+        await save_upload(file, zip_path, MAX_FILE_SIZE)
 
         try:
             with zipfile.ZipFile(zip_path, "r") as zf:
@@ -464,11 +461,15 @@ async def import_obsidian(
 
         await db.commit()
 
+        # Removing the extracted tree can take a while for big vaults;
+        # do it after the response is sent
+        background_tasks.add_task(shutil.rmtree, tmp_dir, ignore_errors=True)
         return ImportResult(
             imported=len(created_notes),
             folder_id=root_folder.id,
             folder_name=vault_name,
             notes=created_notes,
         )
-    finally:
+    except BaseException:
         shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
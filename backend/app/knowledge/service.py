@@ -296,12 +296,12 @@ async def check_readiness(db: AsyncSession, user_id: int, note_id: int) -> dict:
 async def _embedding_match(norm_prereq: str, user_concepts: list[UserConcept], threshold: float = 0.85):
     """Fallback: use embedding cosine similarity to find a matching concept."""
     try:
-        from app.search.service import embed_text
-        prereq_emb = await embed_text(norm_prereq)
+        from app.search.service import embed_query
+        prereq_emb = await embed_query(norm_prereq)
         best_score = 0.0
         best_match = None
         for uc in user_concepts:
-            uc_emb = await embed_text(uc.normalized)
+            uc_emb = await embed_query(uc.normalized)
             sim = _cosine_similarity(prereq_emb, uc_emb)
             if sim > best_score:
                 best_score = sim
@@ -4,7 +4,7 @@ import json
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import case, select, func as sa_func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.cache import cache_get, cache_set
@@ -89,23 +89,20 @@ async def _build_learner_context(db: AsyncSession, user_id: int) -> str:
 
     # 2. Quiz stats
     try:
+        pct = case(
+            (QuizAttempt.total_questions > 0,
+             QuizAttempt.score * 100.0 / QuizAttempt.total_questions),
+            else_=0,
+        )
         attempts_r = await db.execute(
-            select(sa_func.count(QuizAttempt.id)).where(QuizAttempt.user_id == user_id)
+            select(sa_func.count(QuizAttempt.id), sa_func.avg(pct))
+            .where(QuizAttempt.user_id == user_id)
         )
-        total_attempts = attempts_r.scalar() or 0
+        total_attempts, avg_pct = attempts_r.one()
 
         if total_attempts > 0:
             has_data = True
-            scores_r = await db.execute(
-                select(QuizAttempt.score, QuizAttempt.total_questions)
-                .where(QuizAttempt.user_id == user_id)
-            )
-            attempts = scores_r.all()
-            percentages = [
-                (a.score / a.total_questions * 100) if a.total_questions > 0 else 0
-                for a in attempts
-            ]
-            avg_pct = round(sum(percentages) / len(percentages))
+            avg_pct = round(avg_pct or 0)
             lines.append(f"Quizzes: {total_attempts} taken, avg {avg_pct}%")
     except Exception:
         logger.debug("Failed to query quiz stats", exc_info=True)
@@ -3,10 +3,11 @@ import logging
 from typing import AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import StreamingResponse
 
+from app.config import settings
 from app.crypto import decrypt_api_key
 from app.deps import get_db, get_current_user
 from app.database import async_session
@@ -51,6 +52,24 @@ def _get_anthropic_key(user: User) -> str | None:
     return None
 
 
+async def _load_history(db: AsyncSession, thread_id: int, limit: int = 0) -> list[dict]:
+    """Thread messages in chronological order; with limit > 0, only the newest `limit`."""
+    stmt = (
+        select(ConversationMessage.role, ConversationMessage.content)
+        .where(ConversationMessage.thread_id == thread_id)
+        .order_by(ConversationMessage.created_at.desc(), ConversationMessage.id.desc())
+    )
+    if limit > 0:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
+    messages = [{"role": role, "content": content} for role, content in reversed(result.all())]
+    if limit > 0:
+        # A cut can land mid-exchange; the API requires the replay to open with a user turn
+        while messages and messages[0]["role"] != "user":
+            messages.pop(0)
+    return messages
+
+
 def _format_sse_event(data: dict) -> bytes:
     return f"data: {json.dumps(data)}\n\n".encode()
 
@@ -182,12 +201,7 @@ async def chat(
             system_prompt += f"\n\n{notes_context}"
 
     # Load conversation history
-    result = await db.execute(
-        select(ConversationMessage)
-        .where(ConversationMessage.thread_id == thread.id)
-        .order_by(ConversationMessage.created_at)
-    )
-    messages = [{"role": m.role, "content": m.content} for m in result.scalars().all()]
+    messages = await _load_history(db, thread.id, settings.CHAT_HISTORY_LIMIT)
 
     thread_id = thread.id
     note_id = thread.note_id
@@ -329,12 +343,9 @@ async def delete_thread(
 ):
     thread = await _get_thread_or_404(db, thread_id, current_user.id)
 
-    result = await db.execute(
-        select(ConversationMessage).where(ConversationMessage.thread_id == thread_id)
+    await db.execute(
+        delete(ConversationMessage).where(ConversationMessage.thread_id == thread_id)
     )
-    for msg in result.scalars().all():
-        await db.delete(msg)
-
     await db.delete(thread)
     await db.commit()
 
@@ -48,7 +48,8 @@ async def lifespan(app: FastAPI):
         datefmt="%H:%M:%S",
     )
     import os
-    os.makedirs("media/files", exist_ok=True)
+    from app.files.router import MEDIA_DIR
+    os.makedirs(MEDIA_DIR, exist_ok=True)
     check_settings()
     await init_db()
     # Mount plugin routes
@@ -57,6 +58,9 @@ async def lifespan(app: FastAPI):
         if info.router:
             app.include_router(info.router, prefix=f"/plugins/{plugin_id}", tags=[f"plugin:{plugin_id}"])
     await init_cache()
+    if settings.PRELOAD_EMBEDDINGS:
+        from app.search.service import warm_model
+        asyncio.create_task(warm_model())
     # Backfill embeddings in background (non-blocking)
     from app.search.service import backfill_embeddings
     asyncio.create_task(backfill_embeddings())
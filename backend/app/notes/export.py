@@ -302,5 +302,5 @@ async def export_pdf(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"PDF export failed for doc {doc_id}")
+        logger.exception("PDF export failed for doc %s", doc_id)
         raise HTTPException(status_code=500, detail=f"PDF generation failed: {e}")
@@ -154,7 +154,7 @@ async def get_note_suggestions(
     """Return semantically similar notes that aren't already linked."""
     import json as _json
     from app.search.models import NoteEmbedding
-    from app.search.service import cosine_similarity
+    from app.search.service import cosine_similarities
 
     # Get the target note's embedding
     result = await db.execute(
@@ -182,7 +182,7 @@ async def get_note_suggestions(
 
     # Get all other embeddings for user's documents
     result = await db.execute(
-        select(NoteEmbedding, Document).join(
+        select(NoteEmbedding.embedding, Document).join(
             Document, NoteEmbedding.document_id == Document.id
         ).where(
             Document.user_id == current_user.id,
@@ -195,9 +195,8 @@ async def get_note_suggestions(
 
     # Compute similarities and rank
     scored = []
-    for emb, doc in rows:
-        doc_vec = _json.loads(emb.embedding)
-        sim = cosine_similarity(target_vec, doc_vec)
+    sims = cosine_similarities(target_vec, [emb for emb, _ in rows])
+    for (_, doc), sim in zip(rows, sims):
         if sim > 0.35:
             scored.append((sim, doc))
 
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime, timezone
 
@@ -289,13 +288,13 @@ async def get_notes_by_concept(
     # Fallback to embedding similarity if no exact match
     if not note_results:
         try:
-            from app.search.service import embed_text, cosine_similarity
+            from app.search.service import embed_query, cosine_similarities
             from app.search.models import NoteEmbedding
 
-            concept_emb = await embed_text(normalized)
+            concept_emb = await embed_query(normalized)
 
             emb_result = await db.execute(
-                select(NoteEmbedding, Document).join(
+                select(NoteEmbedding.embedding, Document).join(
                     Document, NoteEmbedding.document_id == Document.id
                 ).where(
                     Document.user_id == current_user.id,
@@ -305,9 +304,8 @@ async def get_notes_by_concept(
             rows = emb_result.all()
 
             scored = []
-            for emb, doc in rows:
-                doc_vec = json.loads(emb.embedding)
-                sim = cosine_similarity(concept_emb, doc_vec)
+            sims = cosine_similarities(concept_emb, [emb for emb, _ in rows])
+            for (_, doc), sim in zip(rows, sims):
                 if sim > 0.35:
                     scored.append((sim, doc))
 
@@ -6,8 +6,9 @@ from typing import Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 
 logger = logging.getLogger(__name__)
-from sqlalchemy import select, or_
+from sqlalchemy import func, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from app.deps import get_db, get_current_user
 from app.auth.models import User
@@ -45,11 +46,22 @@ def extract_preview_image(content: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def doc_to_list_response(doc: Document) -> DocumentListResponse:
+# List views only show the first 200 chars, so slice in SQL and leave the
+# full note body unloaded.
+_PREVIEW = func.coalesce(func.substr(Document.content, 1, 200), "")
+
+
+def _select_for_list():
+    return select(Document, _PREVIEW).options(defer(Document.content))
+
+
+def doc_to_list_response(doc: Document, preview: str | None = None) -> DocumentListResponse:
+    if preview is None:
+        preview = doc.content[:200] if doc.content else ""
     return DocumentListResponse(
         id=doc.id,
         title=doc.title,
-        preview=doc.content[:200] if doc.content else "",
+        preview=preview,
         type=doc.type,
         user_id=doc.user_id,
         folder_id=doc.folder_id,
@@ -101,7 +113,7 @@ async def list_documents(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    stmt = select(Document).where(
+    stmt = _select_for_list().where(
         Document.user_id == current_user.id,
         Document.deleted == False,  # noqa: E712
     )
@@ -115,8 +127,7 @@ async def list_documents(
     stmt = stmt.order_by(Document.updated_at.desc())
 
     result = await db.execute(stmt)
-    docs = result.scalars().all()
-    return [doc_to_list_response(d) for d in docs]
+    return [doc_to_list_response(d, preview) for d, preview in result.all()]
 
 
 @router.post("", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
@@ -169,12 +180,11 @@ async def list_trash(
     current_user: User = Depends(get_current_user),
 ):
     result = await db.execute(
-        select(Document)
+        _select_for_list()
         .where(Document.user_id == current_user.id, Document.deleted == True)  # noqa: E712
         .order_by(Document.deleted_at.desc())
     )
-    docs = result.scalars().all()
-    return [doc_to_list_response(d) for d in docs]
+    return [doc_to_list_response(d, preview) for d, preview in result.all()]
 
 
 # ── Folders ────────────────────────────────────────────────────────────────────
@@ -720,7 +730,7 @@ async def search_documents(
 ):
     pattern = f"%{body.query}%"
     result = await db.execute(
-        select(Document).where(
+        _select_for_list().where(
             Document.user_id == current_user.id,
             Document.deleted == False,  # noqa: E712
             or_(
@@ -729,8 +739,7 @@ async def search_documents(
             ),
         ).order_by(Document.updated_at.desc())
     )
-    docs = result.scalars().all()
-    return [doc_to_list_response(d) for d in docs]
+    return [doc_to_list_response(d, preview) for d, preview in result.all()]
 
 
 # ── Tags ───────────────────────────────────────────────────────────────────────
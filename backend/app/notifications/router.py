@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import select, update, func as sa_func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import get_db, get_current_user
@@ -73,13 +73,13 @@ async def mark_all_read(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(Notification).where(
+    await db.execute(
+        update(Notification)
+        .where(
             Notification.user_id == current_user.id,
             Notification.is_read == False,  # noqa: E712
         )
+        .values(is_read=True)
     )
-    for notif in result.scalars().all():
-        notif.is_read = True
     await db.commit()
     return {"detail": "All notifications marked as read"}
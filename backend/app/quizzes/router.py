@@ -1,7 +1,7 @@
 import json
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
-from sqlalchemy import select, func as sa_func
+from sqlalchemy import case, select, func as sa_func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import get_db, get_current_user
@@ -172,27 +172,19 @@ async def get_stats(
     )
     total_quizzes = result.scalar() or 0
 
-    # Total attempts
+    # Attempt count plus average and best score (as percentage), aggregated in SQL
+    pct = case(
+        (QuizAttempt.total_questions > 0,
+         QuizAttempt.score * 100.0 / QuizAttempt.total_questions),
+        else_=0,
+    )
     result = await db.execute(
-        select(sa_func.count(QuizAttempt.id)).where(QuizAttempt.user_id == current_user.id)
+        select(sa_func.count(QuizAttempt.id), sa_func.avg(pct), sa_func.max(pct))
+        .where(QuizAttempt.user_id == current_user.id)
     )
-    total_attempts = result.scalar() or 0
-
-    # Average and best score (as percentage)
-    average_score = 0.0
-    best_score = 0.0
-    if total_attempts > 0:
-        result = await db.execute(
-            select(QuizAttempt.score, QuizAttempt.total_questions)
-            .where(QuizAttempt.user_id == current_user.id)
-        )
-        attempts = result.all()
-        percentages = [
-            (a.score / a.total_questions * 100) if a.total_questions > 0 else 0
-            for a in attempts
-        ]
-        average_score = round(sum(percentages) / len(percentages), 1)
-        best_score = round(max(percentages), 1)
+    total_attempts, avg_pct, max_pct = result.one()
+    average_score = round(avg_pct or 0.0, 1)
+    best_score = round(max_pct or 0.0, 1)
 
     return QuizStatsResponse(
         total_quizzes=total_quizzes,
@@ -114,40 +114,15 @@ async def get_review_stats(
         now.year, now.month, now.day, tzinfo=timezone.utc
     )
 
-    # total_scheduled
     result = await db.execute(
-        select(sa_func.count(ReviewSchedule.id)).where(
-            ReviewSchedule.user_id == current_user.id,
-        )
-    )
-    total_scheduled = result.scalar() or 0
-
-    # due_now
-    result = await db.execute(
-        select(sa_func.count(ReviewSchedule.id)).where(
-            ReviewSchedule.user_id == current_user.id,
-            ReviewSchedule.next_review <= now,
-        )
-    )
-    due_now = result.scalar() or 0
-
-    # reviewed_today
-    result = await db.execute(
-        select(sa_func.count(ReviewSchedule.id)).where(
-            ReviewSchedule.user_id == current_user.id,
-            ReviewSchedule.last_reviewed >= today_start,
-        )
-    )
-    reviewed_today = result.scalar() or 0
-
-    # mastered (interval >= 21)
-    result = await db.execute(
-        select(sa_func.count(ReviewSchedule.id)).where(
-            ReviewSchedule.user_id == current_user.id,
-            ReviewSchedule.interval >= 21,
-        )
+        select(
+            sa_func.count(ReviewSchedule.id),
+            sa_func.count(ReviewSchedule.id).filter(ReviewSchedule.next_review <= now),
+            sa_func.count(ReviewSchedule.id).filter(ReviewSchedule.last_reviewed >= today_start),
+            sa_func.count(ReviewSchedule.id).filter(ReviewSchedule.interval >= 21),
+        ).where(ReviewSchedule.user_id == current_user.id)
     )
-    mastered = result.scalar() or 0
+    total_scheduled, due_now, reviewed_today, mastered = result.one()
 
     return ReviewStatsResponse(
         total_scheduled=total_scheduled,
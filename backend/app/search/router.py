@@ -1,7 +1,7 @@
 import json
-from itertools import combinations
 from typing import Optional
 
+import numpy as np
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from sqlalchemy import select
@@ -13,7 +13,7 @@ from app.notes.models import Document, DocumentLink
 from app.notes.schemas import TagResponse
 from app.search.models import NoteEmbedding
 from app.search.schemas import HybridSearchRequest, HybridSearchResponse, SearchResultItem
-from app.search.service import hybrid_search, cosine_similarity
+from app.search.service import hybrid_search, similarity_matrix
 
 router = APIRouter()
 
@@ -110,13 +110,14 @@ async def knowledge_graph(
     ]
 
     edges = []
-    for (doc_a, vec_a), (doc_b, vec_b) in combinations(parsed, 2):
-        weight = cosine_similarity(vec_a, vec_b)
-        if weight > 0.4:
+    if parsed:
+        # Score every pair at once and keep the upper triangle (each pair once)
+        sims = similarity_matrix([vec for _, vec in parsed])
+        for i, j in zip(*np.nonzero(np.triu(sims > 0.4, k=1))):
             edges.append(KnowledgeGraphEdge(
-                source=doc_a.id,
-                target=doc_b.id,
-                weight=round(weight, 4),
+                source=parsed[i][0].id,
+                target=parsed[j][0].id,
+                weight=round(float(sims[i, j]), 4),
             ))
 
     # Add explicit user-created links as strong edges
@@ -1,27 +1,45 @@
 import asyncio
 import hashlib
 import json
+import logging
 import math
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import async_session
 from app.notes.models import Document
 from app.search.models import NoteEmbedding
 
+logger = logging.getLogger(__name__)
+
 _executor = ThreadPoolExecutor(max_workers=1)
+BACKFILL_BATCH_SIZE = 32
 _model = None
+_model_lock = threading.Lock()
 
 
 def _get_model():
     global _model
-    if _model is None:
-        from fastembed import TextEmbedding
-        _model = TextEmbedding("BAAI/bge-small-en-v1.5")
+    if _model is not None:
+        return _model
+    # Double-checked so a caller outside _executor can never load a second copy.
+    with _model_lock:
+        if _model is None:
+            from fastembed import TextEmbedding
+            # Cap onnxruntime's thread pool so several uvicorn/celery workers on
+            # one host don't each spin up a thread per core and oversubscribe.
+            _model = TextEmbedding(
+                "BAAI/bge-small-en-v1.5",
+                threads=settings.EMBED_THREADS or None,
+            )
     return _model
 
 
@@ -31,19 +49,60 @@ def _embed_sync(text: str) -> list[float]:
     return embeddings[0].tolist()
 
 
+def _embed_batch_sync(texts: list[str]) -> list[list[float]]:
+    model = _get_model()
+    return [e.tolist() for e in model.embed(texts, batch_size=len(texts))]
+
+
 async def embed_text(text: str) -> list[float]:
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(_executor, _embed_sync, text)
 
 
+async def embed_texts(texts: list[str]) -> list[list[float]]:
+    """Embed several texts in one model call (one onnxruntime batch)."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_executor, _embed_batch_sync, texts)
+
+
+@lru_cache(maxsize=1024)
+def _embed_query_sync(text: str) -> tuple[float, ...]:
+    return tuple(_embed_sync(text))
+
+
+async def embed_query(text: str) -> list[float]:
+    """Embed a short query or concept name, memoized on its normalized form.
+
+    Searches and concept lookups repeat the same few strings constantly; the
+    model is uncased, so lowercasing and collapsing whitespace don't change
+    the vector. Use embed_text for document bodies, which would just churn
+    the cache.
+    """
+    normalized = " ".join(text.lower().split())
+    loop = asyncio.get_event_loop()
+    return list(await loop.run_in_executor(_executor, _embed_query_sync, normalized))
+
+
+async def warm_model() -> None:
+    """Load the model and run one dummy embedding so the first search doesn't pay for it."""
+    try:
+        await embed_text("warmup")
+    except Exception as e:
+        logger.warning("Embedding model warmup failed: %s", e)
+
+
 def _content_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def _document_text(doc: Document) -> str:
+    return f"{doc.title}\n{doc.content}"[:2000]
+
+
 async def embed_document(db: AsyncSession, doc: Document) -> None:
     if doc.type in ("canvas", "moodboard"):
         return
-    text = f"{doc.title}\n{doc.content}"[:2000]
+    text = _document_text(doc)
     h = _content_hash(text)
 
     result = await db.execute(
@@ -79,6 +138,20 @@ async def embed_document_background(doc_id: int) -> None:
             await embed_document(db, doc)
 
 
+async def _embed_documents_one_by_one(db: AsyncSession, doc_ids: list[int]) -> None:
+    for doc_id in doc_ids:
+        try:
+            # Queried one at a time: a rollback below expires anything already loaded
+            doc = (await db.execute(
+                select(Document).where(Document.id == doc_id)
+            )).scalar_one_or_none()
+            if doc:
+                await embed_document(db, doc)
+        except Exception as e:
+            await db.rollback()
+            logger.warning("Failed to embed doc %s: %s", doc_id, e)
+
+
 async def backfill_embeddings() -> None:
     async with async_session() as db:
         result = await db.execute(
@@ -87,12 +160,31 @@ async def backfill_embeddings() -> None:
                 ~Document.id.in_(select(NoteEmbedding.document_id))
             )
         )
-        docs = result.scalars().all()
-        for doc in docs:
+        # Nothing is embedded yet for these, so skip embed_document's per-doc
+        # lookup and feed the model whole batches instead of one text at a time.
+        # Texts are captured up front since a rollback expires the loaded docs.
+        pending = [
+            (d.id, _document_text(d)) for d in result.scalars().all()
+            if d.type not in ("canvas", "moodboard")
+        ]
+        for i in range(0, len(pending), BACKFILL_BATCH_SIZE):
+            batch = pending[i:i + BACKFILL_BATCH_SIZE]
             try:
-                await embed_document(db, doc)
+                vecs = await embed_texts([text for _, text in batch])
+                for (doc_id, text), vec in zip(batch, vecs):
+                    db.add(NoteEmbedding(
+                        document_id=doc_id,
+                        embedding=json.dumps(vec),
+                        content_hash=_content_hash(text),
+                    ))
+                await db.commit()
             except Exception as e:
-                print(f"Failed to embed doc {doc.id}: {e}")
+                # e.g. a doc in the batch was embedded by a save in the meantime;
+                # retry this batch one doc at a time so only the bad row is lost
+                await db.rollback()
+                logger.warning("Batch embed of docs %s..%s failed, retrying per doc: %s",
+                               batch[0][0], batch[-1][0], e)
+                await _embed_documents_one_by_one(db, [doc_id for doc_id, _ in batch])
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
@@ -104,6 +196,34 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+def cosine_similarities(query_vec: list[float], embeddings: list[str]) -> list[float]:
+    """Cosine similarity of query_vec against each JSON-encoded embedding.
+
+    The embeddings are stacked into one float32 matrix so scoring a user's
+    whole library is a single matrix-vector product instead of a Python loop
+    per document.
+    """
+    if not embeddings:
+        return []
+    mat = np.array([json.loads(e) for e in embeddings], dtype=np.float32)
+    q = np.asarray(query_vec, dtype=np.float32)
+    denom = np.linalg.norm(mat, axis=1) * np.linalg.norm(q)
+    sims = np.divide(mat @ q, denom, out=np.zeros(len(mat), dtype=np.float32), where=denom > 0)
+    return sims.tolist()
+
+
+
+def similarity_matrix(vectors: list[list[float]]) -> np.ndarray:
+    """Pairwise cosine similarities of vectors as an n x n float32 matrix.
+
+    Rows are normalized once so the whole matrix is a single `m @ m.T`;
+    zero vectors score 0 against everything.
+    """
+    mat = np.array(vectors, dtype=np.float32).reshape(len(vectors), -1)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    mat = np.divide(mat, norms, out=np.zeros_like(mat), where=norms > 0)
+    return mat @ mat.T
+
 async def keyword_search(
     db: AsyncSession, user_id: int, query: str
 ) -> dict[int, tuple[float, Document]]:
@@ -179,11 +299,11 @@ async def keyword_search_flashcards(
 async def semantic_search(
     db: AsyncSession, user_id: int, query: str
 ) -> dict[int, tuple[float, Document]]:
-    query_vec = await embed_text(query)
+    query_vec = await embed_query(query)
 
     # Get all embeddings for user's documents
     result = await db.execute(
-        select(NoteEmbedding, Document).join(
+        select(NoteEmbedding.embedding, Document).join(
             Document, NoteEmbedding.document_id == Document.id
         ).where(
             Document.user_id == user_id,
@@ -193,9 +313,8 @@ async def semantic_search(
     rows = result.all()
     scores: dict[int, tuple[float, Document]] = {}
 
-    for emb, doc in rows:
-        doc_vec = json.loads(emb.embedding)
-        sim = cosine_similarity(query_vec, doc_vec)
+    sims = cosine_similarities(query_vec, [emb for emb, _ in rows])
+    for (_, doc), sim in zip(rows, sims):
         if sim > 0.3:
             scores[doc.id] = (sim, doc)
 
@@ -258,7 +258,6 @@ async def send_friend_request(
             existing.status = "pending"
             existing.requester_id = current_user.id
             existing.addressee_id = target.id
-            existing.updated_at = datetime.now(timezone.utc)
             await db.commit()
             create_notification(db, target.id, "friend_request", f"{current_user.username} sent you a friend request", link="/groups")
             await db.commit()
@@ -290,7 +289,6 @@ async def accept_friend_request(
         raise HTTPException(status_code=404, detail="Friend request not found")
 
     friendship.status = "accepted"
-    friendship.updated_at = datetime.now(timezone.utc)
     await db.commit()
     return {"detail": "Friend request accepted"}
 
@@ -313,7 +311,6 @@ async def reject_friend_request(
         raise HTTPException(status_code=404, detail="Friend request not found")
 
     friendship.status = "rejected"
-    friendship.updated_at = datetime.now(timezone.utc)
     await db.commit()
 
 
@@ -1185,17 +1182,24 @@ async def unpin_message(
 @router.get("/groups/{group_id}/pinned-messages", response_model=list[MessageResponse])
 async def list_pinned_messages(
     group_id: int,
+    limit: int | None = Query(None, ge=1, le=100),
+    offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     await _require_group_member(db, group_id, current_user.id)
 
-    result = await db.execute(
+    # Unpaged by default: the group view lists every pin in one call
+    stmt = (
         select(GroupMessage, User.username)
         .join(User, GroupMessage.user_id == User.id)
         .where(GroupMessage.group_id == group_id, GroupMessage.is_pinned == 1)
-        .order_by(GroupMessage.created_at.desc())
+        .order_by(GroupMessage.created_at.desc(), GroupMessage.id.desc())
+        .offset(offset)
     )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    result = await db.execute(stmt)
     rows = result.all()
 
     msg_ids = [m.id for m, _ in rows]
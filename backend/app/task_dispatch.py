@@ -96,3 +96,31 @@ def dispatch_gcal_studyplan_item_sync(
             async with async_session() as s:
                 await sync_studyplan_item_to_gcal(item_id, topic, item_date, description, completed, user_id, s)
         background_tasks.add_task(_sync)
+
+
+def dispatch_transcribe_audio(
+    file_id: int,
+    file_path: str,
+    encrypted_openai_key: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
+):
+    # The key travels encrypted through the broker and is decrypted where it is used
+    if celery_app:
+        from app.tasks import transcribe_audio_task
+        transcribe_audio_task.delay(file_id, file_path, encrypted_openai_key)
+    elif background_tasks:
+        from app.files.transcription import transcribe_audio_background
+        background_tasks.add_task(
+            transcribe_audio_background, file_id, file_path,
+            _decrypt_or_none(encrypted_openai_key),
+        )
+
+
+def _decrypt_or_none(ciphertext: Optional[str]) -> Optional[str]:
+    if not ciphertext:
+        return None
+    from app.crypto import decrypt_api_key
+    try:
+        return decrypt_api_key(ciphertext)
+    except Exception:
+        return None
@@ -2,9 +2,14 @@
 
 import logging
 from app.celery_app import celery_app
+from app.database import import_models
 
 _logger = logging.getLogger(__name__)
 
+# A worker only imports this module, so map every model before any task
+# touches the ORM (relationships and foreign keys span modules)
+import_models()
+
 
 def _get_sync_session():
     """Create a synchronous database session for Celery workers."""
@@ -91,3 +96,14 @@ if celery_app:
                 await sync_studyplan_item_to_gcal(item_id, topic, d, description, completed, user_id, s)
 
         asyncio.run(_run())
+
+    @celery_app.task(name="transcribe_audio")
+    def transcribe_audio_task(file_id: int, file_path: str, encrypted_openai_key: str | None):
+        """Transcribe an uploaded audio file off the web worker."""
+        import asyncio
+        from app.files.transcription import transcribe_audio_background
+        from app.task_dispatch import _decrypt_or_none
+
+        asyncio.run(transcribe_audio_background(
+            file_id, file_path, _decrypt_or_none(encrypted_openai_key)
+        ))
@@ -5,6 +5,7 @@ Provides:
 - In-memory SQLite async database (per-test isolation)
 - httpx.AsyncClient wired to the FastAPI app via ASGITransport
 - Authenticated header helpers (two separate users)
+- The first user's id, for seeding rows directly through the session
 """
 
 import pytest_asyncio
@@ -24,29 +25,8 @@ async def setup_db():
     test_session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
 
     # Import Base and every model module so metadata is populated.
-    from app.database import Base
-    import app.auth.models  # noqa: F401
-    import app.notes.models  # noqa: F401
-    import app.llm.models  # noqa: F401
-    import app.flashcards.models  # noqa: F401
-    import app.feynman.models  # noqa: F401
-    import app.annotations.models  # noqa: F401
-    import app.search.models  # noqa: F401
-    import app.pomodoro.models  # noqa: F401
-    import app.todos.models  # noqa: F401
-    import app.files.models  # noqa: F401
-    import app.file_annotations.models  # noqa: F401
-    import app.studyplan.models  # noqa: F401
-    import app.lookups.models  # noqa: F401
-    import app.quizzes.models  # noqa: F401
-    import app.integrations.models  # noqa: F401
-    import app.social.models  # noqa: F401
-    import app.forum.models  # noqa: F401
-    import app.notifications.models  # noqa: F401
-    import app.knowledge.models  # noqa: F401
-    import app.automations.models  # noqa: F401
-    import app.reviews.models  # noqa: F401
-    import app.plugins.models  # noqa: F401
+    from app.database import Base, import_models
+    import_models()
 
     # Create all tables in the test database
     async with test_engine.begin() as conn:
@@ -109,6 +89,13 @@ async def auth_headers(client: AsyncClient) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest_asyncio.fixture
+async def user_id(client: AsyncClient, auth_headers: dict[str, str]) -> int:
+    resp = await client.get("/auth/me", headers=auth_headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json()["id"]
+
+
 @pytest_asyncio.fixture
 async def second_user_headers(client: AsyncClient) -> dict[str, str]:
     resp = await client.post("/auth/register", json={
@@ -119,3 +106,10 @@ async def second_user_headers(client: AsyncClient) -> dict[str, str]:
     assert resp.status_code == 201, f"Registration failed: {resp.text}"
     token = resp.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def second_user_id(client: AsyncClient, second_user_headers: dict[str, str]) -> int:
+    resp = await client.get("/auth/me", headers=second_user_headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json()["id"]
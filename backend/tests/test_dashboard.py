@@ -113,6 +113,26 @@ async def test_dashboard_trends_custom_weeks(client: AsyncClient, auth_headers:
     assert len(data["quiz_accuracy"]) == 4
 
 
+async def test_dashboard_trends_current_week(client: AsyncClient, auth_headers: dict):
+    card = await _create_flashcard(client, auth_headers)
+    resp = await client.post(
+        f"/flashcards/{card['id']}/review", json={"quality": 4}, headers=auth_headers
+    )
+    assert resp.status_code == 200, resp.text
+    resp = await client.post("/pomodoro", json={
+        "session_type": "focus", "duration_minutes": 25, "planned_minutes": 25,
+    }, headers=auth_headers)
+    assert resp.status_code == 201, resp.text
+
+    resp = await client.get("/dashboard/trends?weeks=4", headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    this_week = data["flashcard_retention"][-1]
+    assert this_week["total"] == 1
+    assert this_week["retention_pct"] == 100
+    assert data["study_minutes"][-1]["minutes"] == 25
+
+
 # ── /dashboard/mastery ───────────────────────────────────────────────────────
 
 
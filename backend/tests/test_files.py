@@ -0,0 +1,106 @@
+"""Tests for the file library endpoints (/files)."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+
+@pytest.fixture(autouse=True)
+def media_dir(tmp_path, monkeypatch):
+    """Keep uploads out of the real media directory."""
+    import app.files.router as files_router
+    monkeypatch.setattr(files_router, "MEDIA_DIR", str(tmp_path))
+    return tmp_path
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+async def _upload(
+    client: AsyncClient,
+    headers: dict,
+    name: str = "diagram.png",
+    content: bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64,
+    content_type: str = "image/png",
+) -> dict:
+    resp = await client.post(
+        "/files",
+        files={"file": (name, content, content_type)},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+# ── Upload ───────────────────────────────────────────────────────────────────
+
+
+async def test_upload_file(client: AsyncClient, auth_headers: dict, media_dir):
+    data = await _upload(client, auth_headers)
+    assert data["original_name"] == "diagram.png"
+    assert data["file_type"] == "image"
+    assert data["mime_type"] == "image/png"
+    assert data["size_bytes"] == 72
+    assert data["has_extracted_text"] is False
+    assert len(list(media_dir.iterdir())) == 1
+
+
+async def test_upload_unsupported_type(client: AsyncClient, auth_headers: dict):
+    resp = await client.post(
+        "/files",
+        files={"file": ("script.exe", b"MZ", "application/octet-stream")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 400
+
+
+async def test_upload_too_large(
+    client: AsyncClient, auth_headers: dict, media_dir, monkeypatch
+):
+    import app.files.router as files_router
+    import app.files.uploads as uploads
+    monkeypatch.setattr(files_router, "MAX_FILE_SIZE", 1024)
+    monkeypatch.setattr(uploads, "UPLOAD_CHUNK_SIZE", 256)
+
+    resp = await client.post(
+        "/files",
+        files={"file": ("big.png", b"\x00" * 2048, "image/png")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 400
+    # The partially written file is cleaned up
+    assert list(media_dir.iterdir()) == []
+
+
+# ── List ─────────────────────────────────────────────────────────────────────
+
+
+async def test_list_files_reports_extracted_text(
+    client: AsyncClient, auth_headers: dict, setup_db
+):
+    from app.files.models import UploadedFile
+
+    with_text = await _upload(client, auth_headers, name="a.png")
+    await _upload(client, auth_headers, name="b.png")
+
+    async with setup_db() as s:
+        f = (await s.execute(
+            select(UploadedFile).where(UploadedFile.id == with_text["id"])
+        )).scalar_one()
+        f.extracted_text = "some text"
+        await s.commit()
+
+    resp = await client.get("/files", headers=auth_headers)
+    assert resp.status_code == 200
+    flags = {f["original_name"]: f["has_extracted_text"] for f in resp.json()}
+    assert flags == {"a.png": True, "b.png": False}
+
+
+async def test_list_files_isolated_between_users(
+    client: AsyncClient, auth_headers: dict, second_user_headers: dict
+):
+    await _upload(client, auth_headers)
+
+    resp = await client.get("/files", headers=second_user_headers)
+    assert resp.status_code == 200
+    assert resp.json() == []
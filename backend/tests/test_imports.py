@@ -0,0 +1,55 @@
+"""Tests for the zip import endpoints (/imports)."""
+
+import io
+import zipfile
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.fixture
+def tmp_dirs(tmp_path, monkeypatch):
+    """Point tempfile.mkdtemp at a known parent so cleanup can be checked."""
+    import tempfile
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def _zip(files: dict[str, str]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+# ── Obsidian ─────────────────────────────────────────────────────────────────
+
+
+async def test_import_obsidian(client: AsyncClient, auth_headers: dict, tmp_dirs):
+    data = _zip({
+        "Welcome.md": "---\ntags: intro\n---\nHello [[Other]]",
+        "sub/Other.md": "Second note",
+        ".obsidian/config.md": "ignored",
+    })
+    resp = await client.post(
+        "/imports/obsidian",
+        files={"file": ("vault.zip", data, "application/zip")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["imported"] == 2
+    assert body["folder_name"] == "vault"
+    # Extracted files are removed once the response is sent
+    assert list(tmp_dirs.iterdir()) == []
+
+
+async def test_import_obsidian_bad_zip(client: AsyncClient, auth_headers: dict, tmp_dirs):
+    resp = await client.post(
+        "/imports/obsidian",
+        files={"file": ("vault.zip", b"not a zip", "application/zip")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 400
+    assert list(tmp_dirs.iterdir()) == []
@@ -0,0 +1,57 @@
+"""Tests for LLM chat helpers (/llm)."""
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+async def _seed_thread(session_factory, user_id: int, roles: list[str]) -> int:
+    """Create a thread with one message per role, content numbered in order."""
+    from app.llm.models import ConversationThread, ConversationMessage
+
+    async with session_factory() as s:
+        thread = ConversationThread(user_id=user_id)
+        s.add(thread)
+        await s.flush()
+        for i, role in enumerate(roles):
+            s.add(ConversationMessage(thread_id=thread.id, role=role, content=f"m{i}"))
+        await s.commit()
+        return thread.id
+
+
+# ── History ──────────────────────────────────────────────────────────────────
+
+
+async def test_load_history_unlimited(user_id: int, setup_db):
+    from app.llm.router import _load_history
+
+    roles = ["user", "assistant", "user", "assistant", "user"]
+    thread_id = await _seed_thread(setup_db, user_id, roles)
+
+    async with setup_db() as s:
+        messages = await _load_history(s, thread_id)
+    assert [m["content"] for m in messages] == ["m0", "m1", "m2", "m3", "m4"]
+    assert [m["role"] for m in messages] == roles
+
+
+async def test_load_history_keeps_newest(user_id: int, setup_db):
+    from app.llm.router import _load_history
+
+    roles = ["user", "assistant", "user", "assistant", "user"]
+    thread_id = await _seed_thread(setup_db, user_id, roles)
+
+    async with setup_db() as s:
+        messages = await _load_history(s, thread_id, limit=3)
+    assert [m["content"] for m in messages] == ["m2", "m3", "m4"]
+
+
+async def test_load_history_trims_leading_assistant(user_id: int, setup_db):
+    from app.llm.router import _load_history
+
+    roles = ["user", "assistant", "user", "assistant", "user"]
+    thread_id = await _seed_thread(setup_db, user_id, roles)
+
+    async with setup_db() as s:
+        # The newest 4 start with an assistant turn, which is dropped
+        messages = await _load_history(s, thread_id, limit=4)
+    assert [m["content"] for m in messages] == ["m2", "m3", "m4"]
+    assert messages[0]["role"] == "user"
@@ -66,6 +66,16 @@ async def test_list_notes(client: AsyncClient, auth_headers: dict):
     assert titles == {"First", "Second"}
 
 
+async def test_list_notes_preview(client: AsyncClient, auth_headers: dict):
+    await _create_note(client, auth_headers, title="Long", content="x" * 500)
+    await _create_note(client, auth_headers, title="Empty", content="")
+
+    resp = await client.get("/notes", headers=auth_headers)
+    assert resp.status_code == 200
+    previews = {n["title"]: n["preview"] for n in resp.json()}
+    assert previews == {"Long": "x" * 200, "Empty": ""}
+
+
 # ---------------------------------------------------------------------------
 # Get by ID
 # ---------------------------------------------------------------------------
@@ -0,0 +1,55 @@
+"""Tests for the notification endpoints (/notifications)."""
+
+from httpx import AsyncClient
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+async def _seed_notifications(session_factory, user_id: int, count: int = 3) -> None:
+    """Insert `count` unread notifications for `user_id`."""
+    from app.notifications.helpers import create_notification
+
+    async with session_factory() as s:
+        for i in range(count):
+            create_notification(s, user_id, "test", f"Notification {i}")
+        await s.commit()
+
+
+# ── List / read ──────────────────────────────────────────────────────────────
+
+
+async def test_list_notifications(
+    client: AsyncClient, auth_headers: dict, user_id: int, setup_db
+):
+    await _seed_notifications(setup_db, user_id)
+
+    resp = await client.get("/notifications", headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["notifications"]) == 3
+    assert data["unread_count"] == 3
+
+
+async def test_mark_all_read(
+    client: AsyncClient,
+    auth_headers: dict,
+    second_user_headers: dict,
+    user_id: int,
+    second_user_id: int,
+    setup_db,
+):
+    await _seed_notifications(setup_db, user_id)
+    await _seed_notifications(setup_db, second_user_id, count=2)
+
+    resp = await client.post("/notifications/read-all", headers=auth_headers)
+    assert resp.status_code == 200
+
+    resp = await client.get("/notifications", headers=auth_headers)
+    data = resp.json()
+    assert data["unread_count"] == 0
+    assert all(n["is_read"] for n in data["notifications"])
+
+    # Other users' notifications are untouched
+    resp = await client.get("/notifications", headers=second_user_headers)
+    assert resp.json()["unread_count"] == 2
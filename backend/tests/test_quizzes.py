@@ -0,0 +1,51 @@
+"""Tests for the quiz endpoints (/quizzes)."""
+
+from httpx import AsyncClient
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+async def _seed_attempts(
+    session_factory, user_id: int, scores: list[tuple[int, int]]
+) -> None:
+    """Insert one quiz with an attempt per (score, total_questions) pair."""
+    from app.quizzes.models import Quiz, QuizAttempt
+
+    async with session_factory() as s:
+        quiz = Quiz(title="Seeded", user_id=user_id, question_count=4)
+        s.add(quiz)
+        await s.flush()
+        for score, total in scores:
+            s.add(QuizAttempt(
+                quiz_id=quiz.id, user_id=user_id, score=score, total_questions=total,
+            ))
+        await s.commit()
+
+
+# ── Stats ────────────────────────────────────────────────────────────────────
+
+
+async def test_quiz_stats_empty(client: AsyncClient, auth_headers: dict):
+    resp = await client.get("/quizzes/stats", headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_attempts"] == 0
+    assert data["average_score"] == 0
+    assert data["best_score"] == 0
+
+
+async def test_quiz_stats(
+    client: AsyncClient, auth_headers: dict, user_id: int, second_user_id: int, setup_db
+):
+    await _seed_attempts(setup_db, user_id, [(1, 4), (3, 4), (0, 0)])
+    await _seed_attempts(setup_db, second_user_id, [(4, 4)])
+
+    resp = await client.get("/quizzes/stats", headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_quizzes"] == 1
+    assert data["total_attempts"] == 3
+    # (25 + 75 + 0) / 3 — empty attempts count as 0%
+    assert data["average_score"] == 33.3
+    assert data["best_score"] == 75.0
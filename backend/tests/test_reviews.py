@@ -130,6 +130,8 @@ async def test_review_stats(client: AsyncClient, auth_headers: dict):
     assert "due_now" in stats
     assert "reviewed_today" in stats
     assert "mastered" in stats
+    assert stats["total_scheduled"] == 0
+    assert stats["due_now"] == 0
 
 
 async def test_review_stats_with_data(client: AsyncClient, auth_headers: dict):
@@ -0,0 +1,173 @@
+"""Tests for the search service (embedding backfill and scoring)."""
+
+import json
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+
+class _FakeModel:
+    """Stands in for the fastembed model, which isn't downloaded in tests."""
+
+    def embed(self, texts, batch_size=None):
+        return [np.array([float(len(t)), 1.0]) for t in texts]
+
+
+@pytest.fixture
+def search_service(setup_db, monkeypatch):
+    import app.search.service as service
+    monkeypatch.setattr(service, "_model", _FakeModel())
+    monkeypatch.setattr(service, "async_session", setup_db)
+    return service
+
+
+async def _seed_docs(session_factory, count: int) -> list[int]:
+    from app.auth.models import User
+    from app.notes.models import Document
+
+    async with session_factory() as s:
+        user = User(email="search@example.com", username="search", hashed_password="x")
+        s.add(user)
+        await s.flush()
+        docs = [
+            Document(user_id=user.id, title=f"Doc {i}", content="body", type="text")
+            for i in range(count)
+        ]
+        s.add_all(docs)
+        await s.commit()
+        return [d.id for d in docs]
+
+
+# ── Backfill ─────────────────────────────────────────────────────────────────
+
+
+async def test_backfill_embeds_all_docs(search_service, setup_db, monkeypatch):
+    from app.search.models import NoteEmbedding
+
+    monkeypatch.setattr(search_service, "BACKFILL_BATCH_SIZE", 2)
+    doc_ids = await _seed_docs(setup_db, 5)
+
+    await search_service.backfill_embeddings()
+
+    async with setup_db() as s:
+        embedded = (await s.execute(select(NoteEmbedding.document_id))).scalars().all()
+    assert sorted(embedded) == doc_ids
+
+
+async def test_backfill_batch_conflict_keeps_other_docs(
+    search_service, setup_db, monkeypatch
+):
+    """A doc embedded by a save mid-backfill must not sink the rest of its batch."""
+    from app.notes.models import Document
+    from app.search.models import NoteEmbedding
+
+    doc_ids = await _seed_docs(setup_db, 3)
+    raced_id = doc_ids[1]
+    original_embed_texts = search_service.embed_texts
+
+    async def racing_embed_texts(texts):
+        async with setup_db() as s:
+            doc = (await s.execute(
+                select(Document).where(Document.id == raced_id)
+            )).scalar_one()
+            s.add(NoteEmbedding(
+                document_id=raced_id,
+                embedding="[9.0, 9.0]",
+                content_hash=search_service._content_hash(search_service._document_text(doc)),
+            ))
+            await s.commit()
+        return await original_embed_texts(texts)
+
+    monkeypatch.setattr(search_service, "embed_texts", racing_embed_texts)
+
+    await search_service.backfill_embeddings()
+
+    async with setup_db() as s:
+        rows = (await s.execute(
+            select(NoteEmbedding.document_id, NoteEmbedding.embedding)
+        )).all()
+    by_doc = dict(rows)
+    assert sorted(by_doc) == doc_ids
+    # The concurrently written embedding is left as is
+    assert json.loads(by_doc[raced_id]) == [9.0, 9.0]
+
+
+# ── Scoring ──────────────────────────────────────────────────────────────────
+
+
+def test_cosine_similarities_matches_pairwise():
+    from app.search.service import cosine_similarities, cosine_similarity
+
+    query = [1.0, 2.0, 3.0]
+    rows = [[3.0, 2.0, 1.0], [1.0, 2.0, 3.0], [-1.0, -2.0, -3.0], [0.5, 0.0, -4.0]]
+
+    sims = cosine_similarities(query, [json.dumps(r) for r in rows])
+    assert sims == pytest.approx([cosine_similarity(query, r) for r in rows], abs=1e-6)
+
+
+def test_cosine_similarities_zero_norm():
+    from app.search.service import cosine_similarities
+
+    # A zero row (and a zero query) score 0 instead of dividing by zero
+    sims = cosine_similarities([1.0, 0.0], [json.dumps([0.0, 0.0]), json.dumps([2.0, 0.0])])
+    assert sims == pytest.approx([0.0, 1.0])
+    assert cosine_similarities([0.0, 0.0], [json.dumps([1.0, 1.0])]) == [0.0]
+
+
+def test_cosine_similarities_empty():
+    from app.search.service import cosine_similarities
+
+    assert cosine_similarities([1.0, 0.0], []) == []
+
+
+def test_similarity_matrix_matches_pairwise():
+    from app.search.service import cosine_similarity, similarity_matrix
+
+    vectors = [[1.0, 2.0, 3.0], [3.0, 2.0, 1.0], [0.0, 0.0, 0.0], [-1.0, -2.0, -3.0]]
+    sims = similarity_matrix(vectors)
+    assert sims.shape == (4, 4)
+    for i, a in enumerate(vectors):
+        for j, b in enumerate(vectors):
+            assert sims[i, j] == pytest.approx(cosine_similarity(a, b), abs=1e-6)
+
+
+# ── Knowledge graph ──────────────────────────────────────────────────────────
+
+
+async def test_knowledge_graph_edges(
+    client: AsyncClient, auth_headers: dict, user_id: int, setup_db
+):
+    from app.notes.models import Document, DocumentLink
+    from app.search.models import NoteEmbedding
+
+    vectors = [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0], [-1.0, 0.0]]
+    async with setup_db() as s:
+        docs = [
+            Document(user_id=user_id, title=f"Doc {i}", content="", type="text")
+            for i in range(4)
+        ]
+        s.add_all(docs)
+        await s.flush()
+        for doc, vec in zip(docs, vectors):
+            s.add(NoteEmbedding(document_id=doc.id, embedding=json.dumps(vec), content_hash="x"))
+        s.add(DocumentLink(source_id=docs[2].id, target_id=docs[3].id, user_id=user_id))
+        await s.commit()
+        ids = [d.id for d in docs]
+
+    resp = await client.get("/search/knowledge-graph", headers=auth_headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert sorted(n["id"] for n in data["nodes"]) == ids
+    edges = {(e["source"], e["target"]): e["weight"] for e in data["edges"]}
+    # Only the near-parallel pair clears the 0.4 threshold, plus the explicit link
+    assert edges.keys() == {(ids[0], ids[1]), (ids[2], ids[3])}
+    assert edges[(ids[0], ids[1])] == pytest.approx(0.9939, abs=1e-4)
+    assert edges[(ids[2], ids[3])] == 1.0
+
+
+async def test_knowledge_graph_empty(client: AsyncClient, auth_headers: dict):
+    resp = await client.get("/search/knowledge-graph", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.json() == {"nodes": [], "edges": []}
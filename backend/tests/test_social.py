@@ -0,0 +1,77 @@
+"""Tests for the study-group endpoints (/social/groups)."""
+
+from httpx import AsyncClient
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+
+async def _create_group(client: AsyncClient, headers: dict, name: str = "Study") -> dict:
+    resp = await client.post("/social/groups", json={"name": name}, headers=headers)
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+async def _post_and_pin(client: AsyncClient, headers: dict, group_id: int, content: str) -> int:
+    resp = await client.post(
+        f"/social/groups/{group_id}/messages", json={"content": content}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    msg_id = resp.json()["id"]
+    resp = await client.post(f"/social/groups/{group_id}/messages/{msg_id}/pin", headers=headers)
+    assert resp.status_code == 200, resp.text
+    return msg_id
+
+
+# ── Pinned messages ──────────────────────────────────────────────────────────
+
+
+async def test_pinned_messages_pagination(client: AsyncClient, auth_headers: dict):
+    group = await _create_group(client, auth_headers)
+    ids = [await _post_and_pin(client, auth_headers, group["id"], f"pin {i}") for i in range(5)]
+    # An unpinned message is never listed
+    resp = await client.post(
+        f"/social/groups/{group['id']}/messages", json={"content": "chatter"}, headers=auth_headers
+    )
+    assert resp.status_code == 201
+
+    url = f"/social/groups/{group['id']}/pinned-messages"
+    resp = await client.get(url, headers=auth_headers)
+    assert resp.status_code == 200
+    assert [m["id"] for m in resp.json()] == ids[::-1]
+
+    first = await client.get(url, params={"limit": 2}, headers=auth_headers)
+    rest = await client.get(url, params={"limit": 2, "offset": 2}, headers=auth_headers)
+    last = await client.get(url, params={"limit": 2, "offset": 4}, headers=auth_headers)
+    pages = [m["id"] for r in (first, rest, last) for m in r.json()]
+    assert pages == ids[::-1]
+
+
+async def test_pinned_messages_unpaged_by_default(
+    client: AsyncClient, auth_headers: dict, setup_db
+):
+    from app.social.models import GroupMessage
+
+    group = await _create_group(client, auth_headers)
+    async with setup_db() as s:
+        s.add_all([
+            GroupMessage(
+                group_id=group["id"], user_id=group["created_by"], content=f"pin {i}", is_pinned=1
+            )
+            for i in range(120)
+        ])
+        await s.commit()
+
+    resp = await client.get(f"/social/groups/{group['id']}/pinned-messages", headers=auth_headers)
+    assert resp.status_code == 200
+    assert len(resp.json()) == 120
+
+
+async def test_pinned_messages_require_membership(
+    client: AsyncClient, auth_headers: dict, second_user_headers: dict
+):
+    group = await _create_group(client, auth_headers)
+    resp = await client.get(
+        f"/social/groups/{group['id']}/pinned-messages", headers=second_user_headers
+    )
+    assert resp.status_code == 403
@@ -0,0 +1,116 @@
+"""Tests for background task dispatch and the Celery worker entry point."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """A SQLite file with every table and one uploaded audio file (id 1)."""
+    from app.auth.models import User
+    from app.database import Base, import_models
+    from app.files.models import UploadedFile
+    import_models()
+
+    path = tmp_path / "worker.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        user = User(email="w@example.com", username="worker", hashed_password="x")
+        s.add(user)
+        s.flush()
+        s.add(UploadedFile(
+            id=1, user_id=user.id, filename="a.mp3", original_name="a.mp3",
+            file_type="audio", mime_type="audio/mpeg", file_path="media/a.mp3", size_bytes=3,
+        ))
+        s.commit()
+    engine.dispose()
+    return path
+
+
+def _extracted_text(path) -> str | None:
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as conn:
+        value = conn.execute(text("SELECT extracted_text FROM uploaded_files WHERE id = 1")).scalar()
+    engine.dispose()
+    return value
+
+
+# ── Worker ───────────────────────────────────────────────────────────────────
+
+
+def test_worker_transcription_saves(file_db):
+    """Run the transcribe task body with only the modules a worker imports."""
+    script = textwrap.dedent("""
+        import asyncio
+        import sys
+
+        import app.tasks  # noqa: F401  (what `celery -A app.celery_app` loads)
+        import app.files.transcription as transcription
+        from app.task_dispatch import _decrypt_or_none
+
+        assert "app.main" not in sys.modules
+
+        async def fake_transcribe(file_path, openai_api_key=None):
+            return "hello from the worker"
+
+        transcription.transcribe_audio = fake_transcribe
+        # Twice, as a worker process handles many tasks
+        for _ in range(2):
+            asyncio.run(transcription.transcribe_audio_background(
+                1, "media/a.mp3", _decrypt_or_none(None)
+            ))
+    """)
+    env = {k: v for k, v in os.environ.items() if k != "REDIS_URL"}
+    env["DATABASE_URL"] = f"sqlite+aiosqlite:///{file_db}"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert _extracted_text(file_db) == "hello from the worker"
+
+
+# ── Dispatch ─────────────────────────────────────────────────────────────────
+
+
+def test_dispatch_transcribe_in_process(monkeypatch):
+    import app.task_dispatch as task_dispatch
+    from app.files.transcription import transcribe_audio_background
+
+    monkeypatch.setattr(task_dispatch, "celery_app", None)
+    background_tasks = BackgroundTasks()
+    task_dispatch.dispatch_transcribe_audio(7, "media/a.mp3", None, background_tasks)
+
+    [task] = background_tasks.tasks
+    assert task.func is transcribe_audio_background
+    assert task.args == (7, "media/a.mp3", None)
+
+
+def test_dispatch_transcribe_celery(monkeypatch):
+    import app.task_dispatch as task_dispatch
+    import app.tasks as tasks
+
+    calls = []
+
+    class _FakeTask:
+        def delay(self, *args):
+            calls.append(args)
+
+    monkeypatch.setattr(task_dispatch, "celery_app", object())
+    monkeypatch.setattr(tasks, "transcribe_audio_task", _FakeTask(), raising=False)
+    background_tasks = BackgroundTasks()
+    task_dispatch.dispatch_transcribe_audio(7, "media/a.mp3", "ciphertext", background_tasks)
+
+    # The key is queued still encrypted and nothing runs in-process
+    assert calls == [(7, "media/a.mp3", "ciphertext")]
+    assert background_tasks.tasks == []